@@ -1,15 +1,23 @@
 package main
 
 import (
+	"context"
 	"flag"
 	"fmt"
 	"log"
+	"net/http"
+	"os"
+	"os/signal"
 	"path/filepath"
+	"syscall"
+	"time"
 
 	"github.com/gin-gonic/gin"
 	"github.com/giulian-coding/kubervise/internal/api"
 	"github.com/giulian-coding/kubervise/internal/capsule"
 	"k8s.io/client-go/dynamic"
+	"k8s.io/client-go/metadata"
+	"k8s.io/client-go/rest"
 	"k8s.io/client-go/tools/clientcmd"
 	"k8s.io/client-go/util/homedir"
 )
@@ -25,24 +33,46 @@ func main() {
 	}
 	flag.Parse()
 
+	// ctx endet bei Ctrl+C bzw. SIGTERM (z.B. Pod-Stopp) – darüber fahren Server und Watches herunter
+	ctx, stop := signal.NotifyContext(context.Background(), os.Interrupt, syscall.SIGTERM)
+	defer stop()
+
 	// Config laden und FEHLER PRÜFEN (verhindert den Panic)
 	config, err := clientcmd.BuildConfigFromFlags("", *kubeconfig)
 	if err != nil {
 		log.Fatalf("Fehler beim Laden der Kubeconfig unter %s: %v", *kubeconfig, err)
 	}
 
+	// Ein gemeinsamer HTTP-Client (Connection-Pool, TLS-Session) für alle K8s-Clients
+	httpClient, err := rest.HTTPClientFor(config)
+	if err != nil {
+		log.Fatalf("Fehler beim Erstellen des HTTP-Clients: %v", err)
+	}
+
 	// Client erstellen und FEHLER PRÜFEN
-	client, err := dynamic.NewForConfig(config)
+	client, err := dynamic.NewForConfigAndClient(config, httpClient)
 	if err != nil {
 		log.Fatalf("Fehler beim Erstellen des K8s Clients: %v", err)
 	}
 
+	// Metadaten-Client: liefert nur Name, Labels & Co. statt des ganzen Objekts
+	metadataClient, err := metadata.NewForConfigAndClient(config, httpClient)
+	if err != nil {
+		log.Fatalf("Fehler beim Erstellen des Metadaten-Clients: %v", err)
+	}
+
 	// Manager initialisieren
-	mgr := capsule.NewManager(client)
+	mgr := capsule.NewManager(client, metadataClient)
+
+	// Informer-Cache starten, damit die List-Endpunkte nicht jedes Mal den API-Server abfragen
+	if err := mgr.StartInformers(ctx); err != nil {
+		log.Fatalf("Fehler beim Starten der Informer: %v", err)
+	}
 
 	// Handler initialisieren
 	tenantHandler := &api.TenantHandler{
-		Manager: mgr,
+		Manager:  mgr,
+		Shutdown: ctx.Done(),
 	}
 
 	r := gin.Default()
@@ -51,7 +81,8 @@ func main() {
 	r.Use(func(c *gin.Context) {
 		c.Writer.Header().Set("Access-Control-Allow-Origin", "http://localhost:5173")
 		c.Writer.Header().Set("Access-Control-Allow-Methods", "GET, POST, OPTIONS, PUT, PATCH, DELETE")
-		c.Writer.Header().Set("Access-Control-Allow-Headers", "Content-Type, X-User-Email")
+		c.Writer.Header().Set("Access-Control-Allow-Headers", "Content-Type, X-User-Email, If-None-Match")
+		c.Writer.Header().Set("Access-Control-Expose-Headers", "ETag") // Sonst kann fetch() den ETag nicht lesen
 
 		if c.Request.Method == "OPTIONS" {
 			c.AbortWithStatus(204)
@@ -60,6 +91,9 @@ func main() {
 		c.Next()
 	})
 
+	// Antworten komprimieren – spart bei großen Listen den Großteil der Bytes
+	r.Use(api.Gzip())
+
 	fmt.Println("🚀 API-Server läuft auf http://localhost:8080")
 
 	// 3. Die Route für das "Railway" Board
@@ -77,7 +111,9 @@ func main() {
 	r.GET("/api/v1/namespaces/:namespaceName/deployments", tenantHandler.ListDeployments)
 	r.POST("/api/v1/namespaces/:namespaceName/deployments", tenantHandler.CreateDeployment)
 	r.DELETE("/api/v1/namespaces/:namespaceName/deployments/:deploymentName", tenantHandler.DeleteDeployment)
+	r.GET("/api/v1/namespaces/:namespaceName/deployments/watch", tenantHandler.WatchDeployments)
 	r.GET("/api/v1/namespaces/:namespaceName/pods", tenantHandler.ListPods)
+	r.GET("/api/v1/namespaces/:namespaceName/pods/watch", tenantHandler.WatchPods)
 
 	// --- Service Routen ---
 	r.GET("/api/v1/namespaces/:namespaceName/services", tenantHandler.ListServices)
@@ -92,5 +128,32 @@ func main() {
 	// --- CLI Ausführung ---
 	r.POST("/api/v1/cli/execute", tenantHandler.ExecuteCLICommand)
 
-	r.Run(":8080")
+	// Eigener http.Server statt r.Run: Keep-Alive-Verbindungen des Frontends werden
+	// wiederverwendet und langsame Clients können keine Goroutinen ewig blockieren.
+	// Kein WriteTimeout, da CLI-Befehle länger laufen dürfen.
+	srv := &http.Server{
+		Addr:              ":8080",
+		Handler:           r,
+		ReadHeaderTimeout: 5 * time.Second,
+		IdleTimeout:       120 * time.Second,
+	}
+
+	go func() {
+		if err := srv.ListenAndServe(); err != nil && err != http.ErrServerClosed {
+			log.Fatalf("Fehler beim Starten des API-Servers: %v", err)
+		}
+	}()
+
+	// Blockiert ohne Polling, bis ein Signal kommt
+	<-ctx.Done()
+	// Ab jetzt beendet ein zweites Ctrl+C den Prozess sofort, statt auf Shutdown zu warten
+	stop()
+	fmt.Println("🛑 Fahre API-Server herunter...")
+
+	// Laufende Requests dürfen noch fertig werden, neue werden nicht mehr angenommen
+	shutdownCtx, cancel := context.WithTimeout(context.Background(), 10*time.Second)
+	defer cancel()
+	if err := srv.Shutdown(shutdownCtx); err != nil {
+		log.Printf("Fehler beim Herunterfahren des API-Servers: %v", err)
+	}
 }
@@ -0,0 +1,52 @@
+package api
+
+import (
+	"fmt"
+	"hash/fnv"
+	"net/http"
+	"strings"
+
+	"github.com/gin-gonic/gin"
+	"github.com/gin-gonic/gin/codec/json"
+)
+
+// respondWithETag serialisiert data genau einmal und versieht die Antwort mit einem ETag.
+// Wie c.JSON läuft das über gins JSON-Codec, die Build-Tags (sonic, go_json) greifen also auch hier.
+// Pollt das Frontend einen unveränderten Stand, antworten wir mit 304 ohne Body.
+func respondWithETag(c *gin.Context, data interface{}) {
+	body, err := json.API.Marshal(data)
+	if err != nil {
+		c.JSON(http.StatusInternalServerError, gin.H{"error": err.Error()})
+		return
+	}
+
+	hash := fnv.New64a()
+	hash.Write(body)
+	// Schwacher ETag, da die Gzip-Middleware die Bytes danach noch verändert
+	etag := fmt.Sprintf(`W/"%x"`, hash.Sum64())
+
+	c.Header("ETag", etag)
+	c.Header("Cache-Control", "no-cache") // Browser soll jedes Mal nachfragen, aber den ETag mitschicken
+
+	if etagMatches(c.GetHeader("If-None-Match"), etag) {
+		c.Status(http.StatusNotModified)
+		return
+	}
+
+	c.Data(http.StatusOK, "application/json; charset=utf-8", body)
+}
+
+// etagMatches wertet If-None-Match aus: "*" oder eine Komma-Liste von ETags.
+// Für If-None-Match gilt der schwache Vergleich, ein "W/" auf einer Seite spielt also keine Rolle.
+func etagMatches(header, etag string) bool {
+	if header == "" {
+		return false
+	}
+	for _, candidate := range strings.Split(header, ",") {
+		candidate = strings.TrimSpace(candidate)
+		if candidate == "*" || strings.TrimPrefix(candidate, "W/") == strings.TrimPrefix(etag, "W/") {
+			return true
+		}
+	}
+	return false
+}
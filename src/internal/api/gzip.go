@@ -0,0 +1,110 @@
+package api
+
+import (
+	"compress/gzip"
+	"io"
+	"strconv"
+	"strings"
+	"sync"
+
+	"github.com/gin-gonic/gin"
+)
+
+// gzipWriterPool recycelt die gzip-Writer, da jeder neue Writer mehrere hundert KB allokiert
+var gzipWriterPool = sync.Pool{
+	New: func() interface{} {
+		gz, _ := gzip.NewWriterLevel(nil, gzip.BestSpeed)
+		return gz
+	},
+}
+
+// gzipResponseWriter komprimiert alles, was der Handler schreibt.
+// Der gzip-Writer wird erst beim ersten Write geholt, damit leere Antworten (204, 304) unverändert bleiben.
+type gzipResponseWriter struct {
+	gin.ResponseWriter
+	gz *gzip.Writer
+}
+
+func (w *gzipResponseWriter) Write(data []byte) (int, error) {
+	if w.gz == nil {
+		// Die Länge stimmt nach dem Komprimieren nicht mehr
+		w.Header().Del("Content-Length")
+		w.Header().Set("Content-Encoding", "gzip")
+
+		w.gz = gzipWriterPool.Get().(*gzip.Writer)
+		w.gz.Reset(w.ResponseWriter)
+	}
+	return w.gz.Write(data)
+}
+
+func (w *gzipResponseWriter) WriteString(s string) (int, error) {
+	return w.Write([]byte(s))
+}
+
+// Flush schreibt auch die im gzip-Writer gepufferten Daten raus (wichtig für Streams)
+func (w *gzipResponseWriter) Flush() {
+	if w.gz != nil {
+		w.gz.Flush()
+	}
+	w.ResponseWriter.Flush()
+}
+
+func (w *gzipResponseWriter) close() {
+	if w.gz == nil {
+		return
+	}
+	w.gz.Close()
+	// Im Pool soll der Writer nicht mehr auf die alte Antwort zeigen
+	w.gz.Reset(io.Discard)
+	gzipWriterPool.Put(w.gz)
+	w.gz = nil
+}
+
+// Gzip komprimiert die Antworten für alle Clients, die "Accept-Encoding: gzip" senden.
+// Die List-Endpunkte liefern bei vielen Pods/Services schnell mehrere hundert KB JSON.
+func Gzip() gin.HandlerFunc {
+	return func(c *gin.Context) {
+		c.Header("Vary", "Accept-Encoding")
+
+		if !acceptsGzip(c.GetHeader("Accept-Encoding")) {
+			c.Next()
+			return
+		}
+
+		writer := &gzipResponseWriter{ResponseWriter: c.Writer}
+		c.Writer = writer
+		defer writer.close()
+
+		c.Next()
+	}
+}
+
+// acceptsGzip wertet Accept-Encoding samt q-Werten aus – "gzip;q=0" heißt ausdrücklich: nicht komprimieren.
+// Ein explizites "gzip" hat Vorrang vor "*".
+func acceptsGzip(header string) bool {
+	gzipQ, wildcardQ := -1.0, -1.0
+	for _, part := range strings.Split(header, ",") {
+		coding, params, _ := strings.Cut(part, ";")
+
+		q := 1.0
+		for _, param := range strings.Split(params, ";") {
+			if value, ok := strings.CutPrefix(strings.TrimSpace(param), "q="); ok {
+				if parsed, err := strconv.ParseFloat(value, 64); err == nil {
+					q = parsed
+				}
+			}
+		}
+
+		switch strings.ToLower(strings.TrimSpace(coding)) {
+		case "gzip":
+			gzipQ = q
+		case "*":
+			wildcardQ = q
+		}
+	}
+
+	if gzipQ >= 0 {
+		return gzipQ > 0
+	}
+	return wildcardQ > 0
+}
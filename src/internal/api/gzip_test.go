@@ -0,0 +1,148 @@
+package api
+
+import (
+	"bytes"
+	"compress/gzip"
+	"io"
+	"net/http"
+	"net/http/httptest"
+	"testing"
+
+	"github.com/gin-gonic/gin"
+)
+
+func newGzipRouter(path string, handler gin.HandlerFunc) *gin.Engine {
+	gin.SetMode(gin.TestMode)
+	r := gin.New()
+	r.Use(Gzip())
+	r.GET(path, handler)
+	return r
+}
+
+func gunzip(t *testing.T, data []byte) string {
+	t.Helper()
+	reader, err := gzip.NewReader(bytes.NewReader(data))
+	if err != nil {
+		t.Fatalf("kein gültiger gzip-Stream: %v", err)
+	}
+	body, err := io.ReadAll(reader)
+	if err != nil {
+		t.Fatalf("gzip-Stream nicht lesbar: %v", err)
+	}
+	return string(body)
+}
+
+func TestGzipCompressesResponse(t *testing.T) {
+	r := newGzipRouter("/", func(c *gin.Context) {
+		c.String(http.StatusOK, "hallo welt")
+	})
+
+	req := httptest.NewRequest(http.MethodGet, "/", nil)
+	req.Header.Set("Accept-Encoding", "br, gzip")
+	rec := httptest.NewRecorder()
+	r.ServeHTTP(rec, req)
+
+	if got := rec.Header().Get("Content-Encoding"); got != "gzip" {
+		t.Fatalf("Content-Encoding = %q, erwartet gzip", got)
+	}
+	if got := rec.Header().Get("Vary"); got != "Accept-Encoding" {
+		t.Errorf("Vary = %q, erwartet Accept-Encoding", got)
+	}
+	if got := gunzip(t, rec.Body.Bytes()); got != "hallo welt" {
+		t.Errorf("Body = %q", got)
+	}
+}
+
+func TestGzipRespectsQZero(t *testing.T) {
+	r := newGzipRouter("/", func(c *gin.Context) {
+		c.String(http.StatusOK, "hallo welt")
+	})
+
+	for _, header := range []string{"", "identity", "gzip;q=0", "gzip; q=0.0, *", "*;q=0"} {
+		req := httptest.NewRequest(http.MethodGet, "/", nil)
+		req.Header.Set("Accept-Encoding", header)
+		rec := httptest.NewRecorder()
+		r.ServeHTTP(rec, req)
+
+		if got := rec.Header().Get("Content-Encoding"); got != "" {
+			t.Errorf("Accept-Encoding %q: Content-Encoding = %q, erwartet keine Kompression", header, got)
+		}
+		if got := rec.Body.String(); got != "hallo welt" {
+			t.Errorf("Accept-Encoding %q: Body = %q", header, got)
+		}
+	}
+}
+
+func TestGzipLeavesNotModifiedEmpty(t *testing.T) {
+	r := newGzipRouter("/", func(c *gin.Context) {
+		c.Status(http.StatusNotModified)
+	})
+
+	req := httptest.NewRequest(http.MethodGet, "/", nil)
+	req.Header.Set("Accept-Encoding", "gzip")
+	rec := httptest.NewRecorder()
+	r.ServeHTTP(rec, req)
+
+	if rec.Code != http.StatusNotModified {
+		t.Fatalf("Status = %d, erwartet 304", rec.Code)
+	}
+	if got := rec.Header().Get("Content-Encoding"); got != "" {
+		t.Errorf("Content-Encoding = %q, bei 304 darf nichts komprimiert werden", got)
+	}
+	if rec.Body.Len() != 0 {
+		t.Errorf("Body hat %d Bytes, erwartet leer", rec.Body.Len())
+	}
+}
+
+func TestGzipFlushSendsBufferedData(t *testing.T) {
+	rec := httptest.NewRecorder()
+	const first, second = "data: eins\n\n", "data: zwei\n\n"
+
+	r := newGzipRouter("/", func(c *gin.Context) {
+		c.Writer.WriteString(first)
+		c.Writer.Flush()
+
+		// Nach dem Flush muss der erste Frame vollständig beim Client lesbar sein
+		reader, err := gzip.NewReader(bytes.NewReader(rec.Body.Bytes()))
+		if err != nil {
+			t.Errorf("nach Flush kein gzip-Header geschrieben: %v", err)
+			return
+		}
+		buf := make([]byte, len(first))
+		if _, err := io.ReadFull(reader, buf); err != nil || string(buf) != first {
+			t.Errorf("nach Flush gelesen %q (%v), erwartet %q", buf, err, first)
+		}
+
+		c.Writer.WriteString(second)
+	})
+
+	req := httptest.NewRequest(http.MethodGet, "/", nil)
+	req.Header.Set("Accept-Encoding", "gzip")
+	r.ServeHTTP(rec, req)
+
+	if !rec.Flushed {
+		t.Error("Flush wurde nicht an den ResponseWriter weitergereicht")
+	}
+	if got := gunzip(t, rec.Body.Bytes()); got != first+second {
+		t.Errorf("Body = %q, erwartet %q", got, first+second)
+	}
+}
+
+func TestAcceptsGzip(t *testing.T) {
+	cases := map[string]bool{
+		"gzip":               true,
+		"gzip, deflate, br":  true,
+		"GZIP;q=0.5":         true,
+		"*":                  true,
+		"gzip;q=0, *":        false,
+		"br;q=1, gzip;q=0":   false,
+		"deflate":            false,
+		"*;q=0":              false,
+		"gzip;level=1;q=0.0": false,
+	}
+	for header, want := range cases {
+		if got := acceptsGzip(header); got != want {
+			t.Errorf("acceptsGzip(%q) = %v, erwartet %v", header, got, want)
+		}
+	}
+}
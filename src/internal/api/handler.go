@@ -10,11 +10,15 @@ import (
 
 type TenantHandler struct {
 	Manager *capsule.Manager
+
+	// Shutdown wird beim Herunterfahren geschlossen und beendet offene Event-Streams,
+	// damit der Server nicht auf sie warten muss (nil = Streams laufen bis der Client geht)
+	Shutdown <-chan struct{}
 }
 
 func (h *TenantHandler) CreateTenant(c *gin.Context) {
 	var input struct {
-		Name  string `json:"name"`
+		Name  string `json:"name" binding:"required"`
 		Owner string `json:"owner"`
 	}
 
@@ -57,7 +61,7 @@ func (h *TenantHandler) ListMyTenants(c *gin.Context) {
 		c.JSON(http.StatusInternalServerError, gin.H{"error": err.Error()})
 		return
 	}
-	c.JSON(http.StatusOK, tenants)
+	respondWithETag(c, tenants)
 }
 
 // Namespaces
@@ -75,14 +79,14 @@ func (h *TenantHandler) ListNamespaces(c *gin.Context) {
 		return
 	}
 
-	c.JSON(http.StatusOK, namespaces)
+	respondWithETag(c, namespaces)
 }
 
 func (h *TenantHandler) CreateNamespace(c *gin.Context) {
 	tenantName := c.Param("tenantName")
 
 	var input struct {
-		Name string `json:"name"`
+		Name string `json:"name" binding:"required"`
 	}
 	if err := c.ShouldBindJSON(&input); err != nil {
 		c.JSON(http.StatusBadRequest, gin.H{"error": "Ungültiges JSON: " + err.Error()})
@@ -120,8 +124,8 @@ func (h *TenantHandler) CreateDeployment(c *gin.Context) {
 	namespaceName := c.Param("namespaceName")
 
 	var input struct {
-		Name  string `json:"name"`
-		Image string `json:"image"`
+		Name  string `json:"name" binding:"required"`
+		Image string `json:"image" binding:"required"`
 	}
 	if err := c.ShouldBindJSON(&input); err != nil {
 		c.JSON(http.StatusBadRequest, gin.H{"error": "Ungültiges JSON: " + err.Error()})
@@ -145,7 +149,7 @@ func (h *TenantHandler) ListDeployments(c *gin.Context) {
 		return
 	}
 
-	c.JSON(http.StatusOK, deployments)
+	respondWithETag(c, deployments)
 }
 
 func (h *TenantHandler) DeleteDeployment(c *gin.Context) {
@@ -159,6 +163,18 @@ func (h *TenantHandler) DeleteDeployment(c *gin.Context) {
 	c.JSON(http.StatusOK, gin.H{"message": "Deployment wird gelöscht"})
 }
 
+// WatchDeployments streamt Deployment-Änderungen (z.B. readyReplicas während eines Rollouts) als Server-Sent Events
+func (h *TenantHandler) WatchDeployments(c *gin.Context) {
+	namespaceName := c.Param("namespaceName")
+
+	stream, err := h.Manager.WatchDeployments(c.Request.Context(), namespaceName)
+	if err != nil {
+		c.JSON(http.StatusInternalServerError, gin.H{"error": err.Error()})
+		return
+	}
+	streamEvents(c, stream, h.Shutdown)
+}
+
 func (h *TenantHandler) ListPods(c *gin.Context) {
 	namespaceName := c.Param("namespaceName")
 
@@ -167,7 +183,19 @@ func (h *TenantHandler) ListPods(c *gin.Context) {
 		c.JSON(http.StatusInternalServerError, gin.H{"error": err.Error()})
 		return
 	}
-	c.JSON(http.StatusOK, pods)
+	respondWithETag(c, pods)
+}
+
+// WatchPods streamt Pod-Änderungen als Server-Sent Events, statt dass das Frontend die ganze Liste pollt
+func (h *TenantHandler) WatchPods(c *gin.Context) {
+	namespaceName := c.Param("namespaceName")
+
+	stream, err := h.Manager.WatchPods(c.Request.Context(), namespaceName)
+	if err != nil {
+		c.JSON(http.StatusInternalServerError, gin.H{"error": err.Error()})
+		return
+	}
+	streamEvents(c, stream, h.Shutdown)
 }
 
 // --- Services ---
@@ -176,11 +204,11 @@ func (h *TenantHandler) CreateService(c *gin.Context) {
 	namespaceName := c.Param("namespaceName")
 
 	var input struct {
-		Name        string `json:"name"`
-		AppName     string `json:"appName"`     // Welches Deployment soll verknüpft werden?
-		Port        int    `json:"port"`        // Nach außen freigegebener Port (z.B. 80)
-		TargetPort  int    `json:"targetPort"`  // Interner Port des Containers (z.B. 80)
-		ServiceType string `json:"serviceType"` // Optional: "NodePort", "LoadBalancer", oder "ClusterIP"
+		Name        string `json:"name" binding:"required"`
+		AppName     string `json:"appName" binding:"required"`    // Welches Deployment soll verknüpft werden?
+		Port        int    `json:"port" binding:"required"`       // Nach außen freigegebener Port (z.B. 80)
+		TargetPort  int    `json:"targetPort" binding:"required"` // Interner Port des Containers (z.B. 80)
+		ServiceType string `json:"serviceType"`                   // Optional: "NodePort", "LoadBalancer", oder "ClusterIP"
 	}
 	if err := c.ShouldBindJSON(&input); err != nil {
 		c.JSON(http.StatusBadRequest, gin.H{"error": "Ungültiges JSON: " + err.Error()})
@@ -204,7 +232,7 @@ func (h *TenantHandler) ListServices(c *gin.Context) {
 		return
 	}
 
-	c.JSON(http.StatusOK, services)
+	respondWithETag(c, services)
 }
 
 func (h *TenantHandler) DeleteService(c *gin.Context) {
@@ -224,8 +252,8 @@ func (h *TenantHandler) CreateNetworkPolicy(c *gin.Context) {
 	targetNamespace := c.Param("namespaceName")
 
 	var input struct {
-		Name            string `json:"name"`
-		SourceNamespace string `json:"sourceNamespace"`
+		Name            string `json:"name" binding:"required"`
+		SourceNamespace string `json:"sourceNamespace" binding:"required"`
 	}
 	if err := c.ShouldBindJSON(&input); err != nil {
 		c.JSON(http.StatusBadRequest, gin.H{"error": "Ungültiges JSON: " + err.Error()})
@@ -249,7 +277,7 @@ func (h *TenantHandler) ListNetworkPolicies(c *gin.Context) {
 		return
 	}
 
-	c.JSON(http.StatusOK, policies)
+	respondWithETag(c, policies)
 }
 
 func (h *TenantHandler) DeleteNetworkPolicy(c *gin.Context) {
@@ -0,0 +1,51 @@
+package api
+
+import (
+	"io"
+	"net/http"
+	"time"
+
+	"github.com/gin-gonic/gin"
+	"github.com/giulian-coding/kubervise/internal/capsule"
+)
+
+// streamEvents schreibt die Events als Server-Sent Events, bis der Client die Verbindung schließt
+// oder shutdown geschlossen wird
+func streamEvents[T comparable](c *gin.Context, stream *capsule.RowStream[T], shutdown <-chan struct{}) {
+	ctx := c.Request.Context()
+
+	// Hält die Verbindung durch Proxies hindurch offen, auch wenn sich nichts ändert
+	heartbeat := time.NewTicker(30 * time.Second)
+	defer heartbeat.Stop()
+
+	// Status und Header sofort rausschicken – sonst bleibt EventSource bei einem ruhigen Namespace
+	// bis zum ersten Heartbeat in CONNECTING hängen. retry setzt die Wartezeit vor einem Reconnect.
+	c.Header("Content-Type", "text/event-stream")
+	c.Header("Cache-Control", "no-cache")
+	c.Status(http.StatusOK)
+	c.Writer.WriteString("retry: 3000\n\n")
+	c.Writer.Flush()
+
+	c.Stream(func(w io.Writer) bool {
+		select {
+		case <-stream.Ready():
+			// Was bereits wartet (z.B. viele Pods bei einem Rollout), geht im selben Flush mit raus
+			for _, event := range stream.Drain() {
+				switch event.Type {
+				case capsule.EventReset, capsule.EventSynced:
+					c.SSEvent(event.Type, "") // Reine Markierung, ohne Zeile
+				default:
+					c.SSEvent(event.Type, event.Row)
+				}
+			}
+			return true
+		case <-heartbeat.C:
+			c.SSEvent("heartbeat", "")
+			return true
+		case <-ctx.Done():
+			return false
+		case <-shutdown:
+			return false
+		}
+	})
+}
@@ -6,6 +6,7 @@ import (
 
 	metav1 "k8s.io/apimachinery/pkg/apis/meta/v1"
 	"k8s.io/apimachinery/pkg/apis/meta/v1/unstructured"
+	"k8s.io/apimachinery/pkg/labels"
 	"k8s.io/apimachinery/pkg/runtime/schema"
 )
 
@@ -21,6 +22,22 @@ var podGVR = schema.GroupVersionResource{
 	Resource: "pods",
 }
 
+// DeploymentInfo ist eine Zeile in der Deployment-Liste des Frontends
+type DeploymentInfo struct {
+	ID            string `json:"id"`
+	Name          string `json:"name"`
+	Image         string `json:"image"`
+	Replicas      int64  `json:"replicas"`
+	ReadyReplicas int64  `json:"readyReplicas"`
+}
+
+// PodInfo ist eine Zeile in der Pod-Liste des Frontends
+type PodInfo struct {
+	ID    string `json:"id"`
+	Name  string `json:"name"`
+	Phase string `json:"phase"` // z.B. Running, Pending, Failed
+}
+
 // CreateDeployment erstellt ein einfaches Deployment mit einem Container
 func (m *Manager) CreateDeployment(ctx context.Context, namespace, name, image string) error {
 	obj := &unstructured.Unstructured{
@@ -58,41 +75,52 @@ func (m *Manager) CreateDeployment(ctx context.Context, namespace, name, image s
 	}
 
 	// WICHTIG: Hier fügen wir .Namespace(namespace) hinzu!
-	_, err := m.client.Resource(deploymentGVR).Namespace(namespace).Create(ctx, obj, metav1.CreateOptions{})
+	created, err := m.client.Resource(deploymentGVR).Namespace(namespace).Create(ctx, obj, metav1.CreateOptions{})
 	if err != nil {
 		return fmt.Errorf("fehler beim Erstellen des Deployments %s: %w", name, err)
 	}
+	waitForCache(ctx, m.informers[deploymentGVR], namespace, name, cacheHasObject(created.GetUID()))
 	return nil
 }
 
-func (m *Manager) ListDeployments(ctx context.Context, namespace string) ([]map[string]interface{}, error) {
-	list, err := m.client.Resource(deploymentGVR).Namespace(namespace).List(ctx, metav1.ListOptions{})
+func (m *Manager) ListDeployments(ctx context.Context, namespace string) ([]DeploymentInfo, error) {
+	items, err := m.list(ctx, deploymentGVR, namespace, labels.Everything())
 	if err != nil {
 		return nil, err
 	}
 
-	var formattedDeployments []map[string]interface{}
-	for _, item := range list.Items {
-		readyReplicas, _, _ := unstructured.NestedInt64(item.Object, "status", "readyReplicas")
-		replicas, _, _ := unstructured.NestedInt64(item.Object, "spec", "replicas")
-
-		containers, _, _ := unstructured.NestedSlice(item.Object, "spec", "template", "spec", "containers")
-		var image string
-		if len(containers) > 0 {
-			if containerMap, ok := containers[0].(map[string]interface{}); ok {
-				image, _ = containerMap["image"].(string)
-			}
+	formattedDeployments := make([]DeploymentInfo, 0, len(items))
+	for _, item := range items {
+		formattedDeployments = append(formattedDeployments, deploymentInfo(item))
+	}
+	return formattedDeployments, nil
+}
+
+// deploymentInfo baut die Frontend-Zeile für ein Deployment.
+// Wir lesen direkt aus den Maps statt mit NestedSlice, das bei jedem Aufruf eine Deep-Copy anlegt.
+func deploymentInfo(item *unstructured.Unstructured) DeploymentInfo {
+	spec, _ := item.Object["spec"].(map[string]interface{})
+	status, _ := item.Object["status"].(map[string]interface{})
+
+	readyReplicas, _, _ := unstructured.NestedInt64(status, "readyReplicas")
+	replicas, _, _ := unstructured.NestedInt64(spec, "replicas")
+
+	containersField, _, _ := unstructured.NestedFieldNoCopy(spec, "template", "spec", "containers")
+	containers, _ := containersField.([]interface{})
+	var image string
+	if len(containers) > 0 {
+		if containerMap, ok := containers[0].(map[string]interface{}); ok {
+			image, _ = containerMap["image"].(string)
 		}
+	}
 
-		formattedDeployments = append(formattedDeployments, map[string]interface{}{
-			"id":            item.GetName(),
-			"name":          item.GetName(),
-			"image":         image,
-			"replicas":      replicas,
-			"readyReplicas": readyReplicas,
-		})
+	return DeploymentInfo{
+		ID:            item.GetName(),
+		Name:          item.GetName(),
+		Image:         image,
+		Replicas:      replicas,
+		ReadyReplicas: readyReplicas,
 	}
-	return formattedDeployments, nil
 }
 
 func (m *Manager) DeleteDeployment(ctx context.Context, namespace, name string) error {
@@ -100,24 +128,30 @@ func (m *Manager) DeleteDeployment(ctx context.Context, namespace, name string)
 	if err != nil {
 		return fmt.Errorf("fehler beim Löschen des Deployments %s: %w", name, err)
 	}
+	waitForCache(ctx, m.informers[deploymentGVR], namespace, name, cacheHasDeletion)
 	return nil
 }
 
-func (m *Manager) ListPods(ctx context.Context, namespace string) ([]map[string]interface{}, error) {
-	list, err := m.client.Resource(podGVR).Namespace(namespace).List(ctx, metav1.ListOptions{})
+func (m *Manager) ListPods(ctx context.Context, namespace string) ([]PodInfo, error) {
+	items, err := m.list(ctx, podGVR, namespace, labels.Everything())
 	if err != nil {
 		return nil, err
 	}
 
-	var formattedPods []map[string]interface{}
-	for _, item := range list.Items {
-		phase, _, _ := unstructured.NestedString(item.Object, "status", "phase")
-
-		formattedPods = append(formattedPods, map[string]interface{}{
-			"id":    item.GetName(),
-			"name":  item.GetName(),
-			"phase": phase, // z.B. Running, Pending, Failed
-		})
+	formattedPods := make([]PodInfo, 0, len(items))
+	for _, item := range items {
+		formattedPods = append(formattedPods, podInfo(item))
 	}
 	return formattedPods, nil
 }
+
+// podInfo baut die Frontend-Zeile für einen Pod (genutzt von ListPods und WatchPods)
+func podInfo(item *unstructured.Unstructured) PodInfo {
+	phase, _, _ := unstructured.NestedString(item.Object, "status", "phase")
+
+	return PodInfo{
+		ID:    item.GetName(),
+		Name:  item.GetName(),
+		Phase: phase,
+	}
+}
@@ -0,0 +1,284 @@
+package capsule
+
+import (
+	"context"
+	"fmt"
+	"sort"
+	"time"
+
+	metav1 "k8s.io/apimachinery/pkg/apis/meta/v1"
+	"k8s.io/apimachinery/pkg/apis/meta/v1/unstructured"
+	"k8s.io/apimachinery/pkg/labels"
+	"k8s.io/apimachinery/pkg/runtime/schema"
+	"k8s.io/apimachinery/pkg/types"
+	"k8s.io/apimachinery/pkg/util/wait"
+	"k8s.io/client-go/dynamic/dynamicinformer"
+	"k8s.io/client-go/informers"
+	"k8s.io/client-go/metadata/metadatainformer"
+	"k8s.io/client-go/tools/cache"
+)
+
+// tenantOwnerIndex indexiert Tenants nach den Namen ihrer Owner (spec.owners[].name)
+const tenantOwnerIndex = "owner"
+
+// namespaceTenantIndex indexiert Namespaces nach dem Tenant-Label, das Capsule setzt
+const namespaceTenantIndex = "tenant"
+
+// cachedGVRs sind die Ressourcen, die wir per List+Watch lokal im Speicher spiegeln.
+// Die List-Endpunkte lesen daraus, statt bei jedem Request den API-Server abzufragen.
+var cachedGVRs = []schema.GroupVersionResource{
+	tenantGVR,
+	deploymentGVR,
+	podGVR,
+	serviceGVR,
+}
+
+// cachedMetadataGVRs brauchen wir nur mit Name und Labels – hier spiegeln wir nur die
+// Metadaten (PartialObjectMetadata) und sparen uns Spec und Status auf dem Draht und im Speicher.
+var cachedMetadataGVRs = []schema.GroupVersionResource{
+	namespaceGVR,
+	networkPolicyGVR,
+}
+
+// StartInformers startet für jede gecachte Ressource einen Informer im Hintergrund.
+// Muss vor dem Start des API-Servers aufgerufen werden. Die Watches laufen, bis ctx endet.
+// Weitere Aufrufe starten nichts neu und liefern nur das Ergebnis des ersten Aufrufs.
+func (m *Manager) StartInformers(ctx context.Context) error {
+	m.informersOnce.Do(func() {
+		m.informersErr = m.startInformers(ctx)
+	})
+	return m.informersErr
+}
+
+func (m *Manager) startInformers(ctx context.Context) error {
+	factory := dynamicinformer.NewDynamicSharedInformerFactory(m.client, 0)
+	m.informers = make(map[schema.GroupVersionResource]informers.GenericInformer, len(cachedGVRs))
+	for _, gvr := range cachedGVRs {
+		m.informers[gvr] = factory.ForResource(gvr)
+
+		transform := stripManagedFields
+		if gvr == podGVR {
+			transform = stripPod
+		}
+		if err := m.informers[gvr].Informer().SetTransform(transform); err != nil {
+			return fmt.Errorf("fehler beim Setzen des Transforms für %s: %w", gvr.Resource, err)
+		}
+	}
+
+	// Tenants zusätzlich nach Owner indexieren – so muss ListTenantsByOwner nicht alle Tenants durchgehen
+	err := m.informers[tenantGVR].Informer().AddIndexers(cache.Indexers{
+		tenantOwnerIndex: func(obj interface{}) ([]string, error) {
+			item, ok := obj.(*unstructured.Unstructured)
+			if !ok {
+				return nil, nil
+			}
+			return tenantOwners(item), nil
+		},
+	})
+	if err != nil {
+		return fmt.Errorf("fehler beim Anlegen des Owner-Index: %w", err)
+	}
+
+	metadataFactory := metadatainformer.NewSharedInformerFactory(m.metadata, 0)
+	m.metadataInformers = make(map[schema.GroupVersionResource]informers.GenericInformer, len(cachedMetadataGVRs))
+	for _, gvr := range cachedMetadataGVRs {
+		m.metadataInformers[gvr] = metadataFactory.ForResource(gvr)
+		if err := m.metadataInformers[gvr].Informer().SetTransform(stripManagedFields); err != nil {
+			return fmt.Errorf("fehler beim Setzen des Transforms für %s: %w", gvr.Resource, err)
+		}
+	}
+
+	// Namespaces nach Tenant indexieren – statt jeden Namespace gegen den Label-Selector zu prüfen
+	err = m.metadataInformers[namespaceGVR].Informer().AddIndexers(cache.Indexers{
+		namespaceTenantIndex: func(obj interface{}) ([]string, error) {
+			item, ok := obj.(metav1.Object)
+			if !ok {
+				return nil, nil
+			}
+			if tenant, ok := item.GetLabels()[tenantLabel]; ok {
+				return []string{tenant}, nil
+			}
+			return nil, nil
+		},
+	})
+	if err != nil {
+		return fmt.Errorf("fehler beim Anlegen des Tenant-Index: %w", err)
+	}
+
+	// Start blockiert nicht – bis ein Informer synchronisiert ist, fallen die List-Helfer auf LIST-Calls zurück
+	factory.Start(ctx.Done())
+	metadataFactory.Start(ctx.Done())
+	return nil
+}
+
+// stripManagedFields entfernt die managedFields, bevor ein Objekt im Cache landet.
+// Die Server-Side-Apply-Buchhaltung ist oft größer als der Rest der Metadaten und wird nirgends gelesen.
+func stripManagedFields(obj interface{}) (interface{}, error) {
+	if item, ok := obj.(metav1.Object); ok {
+		item.SetManagedFields(nil)
+	}
+	return obj, nil
+}
+
+// stripPod behält von einem Pod nur, was podInfo braucht: die Metadaten und status.phase.
+// Pods sind die mit Abstand zahlreichste Ressource im Cache.
+func stripPod(obj interface{}) (interface{}, error) {
+	item, ok := obj.(*unstructured.Unstructured)
+	if !ok {
+		return stripManagedFields(obj)
+	}
+
+	item.SetManagedFields(nil)
+	phase, _, _ := unstructured.NestedString(item.Object, "status", "phase")
+	delete(item.Object, "spec")
+	item.Object["status"] = map[string]interface{}{"phase": phase}
+	return item, nil
+}
+
+// cacheWriteTimeout begrenzt, wie lange ein Schreibzugriff darauf wartet, dass der Cache ihn zeigt
+const cacheWriteTimeout = 2 * time.Second
+
+// waitForCache wartet, bis der Informer-Cache einen eigenen Schreibzugriff widerspiegelt.
+// Die List-Endpunkte lesen aus dem Cache – ohne das Warten fehlt ein gerade erstelltes Objekt
+// oft noch in der Liste, die das Frontend direkt danach lädt.
+// reflected bekommt das Objekt aus dem Cache bzw. nil, wenn es dort (nicht mehr) liegt.
+func waitForCache(ctx context.Context, informer informers.GenericInformer, namespace, name string, reflected func(obj metav1.Object) bool) {
+	// Ohne synchronisierten Informer gehen die Listen direkt an den API-Server, und der liefert
+	// ohne ResourceVersion einen konsistenten Stand – der Schreibzugriff ist darin schon enthalten
+	if informer == nil || !informer.Informer().HasSynced() {
+		return
+	}
+
+	key := name
+	if namespace != "" {
+		key = namespace + "/" + name
+	}
+	store := informer.Informer().GetStore()
+
+	// Ein Timeout ist kein Fehler: der Schreibzugriff selbst hat geklappt, die Liste hinkt nur kurz hinterher
+	_ = wait.PollUntilContextTimeout(ctx, 20*time.Millisecond, cacheWriteTimeout, true, func(context.Context) (bool, error) {
+		obj, exists, err := store.GetByKey(key)
+		if err != nil {
+			return false, err
+		}
+		if !exists {
+			return reflected(nil), nil
+		}
+		item, ok := obj.(metav1.Object)
+		if !ok {
+			return true, nil
+		}
+		return reflected(item), nil
+	})
+}
+
+// cacheHasObject ist erfüllt, sobald genau dieses Objekt (gleiche UID) im Cache liegt
+func cacheHasObject(uid types.UID) func(obj metav1.Object) bool {
+	return func(obj metav1.Object) bool {
+		return obj != nil && obj.GetUID() == uid
+	}
+}
+
+// cacheHasDeletion ist erfüllt, sobald das Objekt weg ist oder gerade gelöscht wird
+// (Namespaces bleiben z.B. wegen ihrer Finalizer eine Weile im Zustand "Terminating")
+func cacheHasDeletion(obj metav1.Object) bool {
+	return obj == nil || obj.GetDeletionTimestamp() != nil
+}
+
+// list liefert alle Objekte einer Ressource, optional gefiltert nach Namespace und Labels.
+// Ist der Informer synchronisiert, kommt das Ergebnis aus dem lokalen Cache, sonst direkt vom API-Server.
+// Die Objekte aus dem Cache werden geteilt und dürfen NICHT verändert werden!
+func (m *Manager) list(ctx context.Context, gvr schema.GroupVersionResource, namespace string, selector labels.Selector) ([]*unstructured.Unstructured, error) {
+	return listObjects(m.informers[gvr], namespace, selector, func(opts metav1.ListOptions) ([]*unstructured.Unstructured, error) {
+		list, err := m.client.Resource(gvr).Namespace(namespace).List(ctx, opts)
+		if err != nil {
+			return nil, err
+		}
+
+		items := make([]*unstructured.Unstructured, 0, len(list.Items))
+		for i := range list.Items {
+			items = append(items, &list.Items[i])
+		}
+		return items, nil
+	})
+}
+
+// listMetadata funktioniert wie list, liefert aber nur die Metadaten der Objekte
+func (m *Manager) listMetadata(ctx context.Context, gvr schema.GroupVersionResource, namespace string, selector labels.Selector) ([]*metav1.PartialObjectMetadata, error) {
+	return listObjects(m.metadataInformers[gvr], namespace, selector, func(opts metav1.ListOptions) ([]*metav1.PartialObjectMetadata, error) {
+		list, err := m.metadata.Resource(gvr).Namespace(namespace).List(ctx, opts)
+		if err != nil {
+			return nil, err
+		}
+
+		items := make([]*metav1.PartialObjectMetadata, 0, len(list.Items))
+		for i := range list.Items {
+			items = append(items, &list.Items[i])
+		}
+		return items, nil
+	})
+}
+
+// listObjects liest aus dem Cache des Informers oder – solange der nicht bereit ist – über fetch vom API-Server.
+// T ist *unstructured.Unstructured bzw. *metav1.PartialObjectMetadata bei Metadaten-Informern.
+func listObjects[T metav1.Object](informer informers.GenericInformer, namespace string, selector labels.Selector, fetch func(metav1.ListOptions) ([]T, error)) ([]T, error) {
+	var items []T
+
+	if informer != nil && informer.Informer().HasSynced() {
+		objs, err := informer.Lister().ByNamespace(namespace).List(selector)
+		if err != nil {
+			return nil, err
+		}
+
+		items = make([]T, 0, len(objs))
+		for _, obj := range objs {
+			if item, ok := obj.(T); ok {
+				items = append(items, item)
+			}
+		}
+	} else {
+		var err error
+		items, err = fetch(metav1.ListOptions{LabelSelector: selector.String()})
+		if err != nil {
+			return nil, err
+		}
+	}
+
+	sortObjects(items)
+	return items, nil
+}
+
+// listByIndex liefert die Objekte, die in einem Index des Informers unter value stehen.
+// T ist *unstructured.Unstructured bzw. *metav1.PartialObjectMetadata bei Metadaten-Informern.
+// Ist der Cache (noch) nicht bereit, ist indexed=false und der Aufrufer muss selbst filtern.
+func listByIndex[T metav1.Object](informer informers.GenericInformer, indexName, value string) (items []T, indexed bool, err error) {
+	if informer == nil || !informer.Informer().HasSynced() {
+		return nil, false, nil
+	}
+
+	objs, err := informer.Informer().GetIndexer().ByIndex(indexName, value)
+	if err != nil {
+		return nil, true, err
+	}
+
+	items = make([]T, 0, len(objs))
+	for _, obj := range objs {
+		if item, ok := obj.(T); ok {
+			items = append(items, item)
+		}
+	}
+
+	sortObjects(items)
+	return items, true, nil
+}
+
+// sortObjects sortiert wie der API-Server nach Namespace und Name.
+// Der Cache ist eine Map – ohne Sortierung würde die Reihenfolge im Frontend springen.
+func sortObjects[T metav1.Object](items []T) {
+	sort.Slice(items, func(i, j int) bool {
+		if items[i].GetNamespace() != items[j].GetNamespace() {
+			return items[i].GetNamespace() < items[j].GetNamespace()
+		}
+		return items[i].GetName() < items[j].GetName()
+	})
+}
@@ -4,13 +4,17 @@ import (
 	"context"
 	"encoding/json"
 	"fmt"
+	"sync"
 
 	"k8s.io/apimachinery/pkg/api/errors"
 	metav1 "k8s.io/apimachinery/pkg/apis/meta/v1"
 	"k8s.io/apimachinery/pkg/apis/meta/v1/unstructured"
+	"k8s.io/apimachinery/pkg/labels"
 	"k8s.io/apimachinery/pkg/runtime/schema"
 	"k8s.io/apimachinery/pkg/types"
 	"k8s.io/client-go/dynamic"
+	"k8s.io/client-go/informers"
+	"k8s.io/client-go/metadata"
 )
 
 // GVR zentral definieren, damit wir uns nicht verschreiben
@@ -22,13 +26,21 @@ var tenantGVR = schema.GroupVersionResource{
 
 // Manager hält die Verbindung zum Cluster
 type Manager struct {
-	client dynamic.Interface
+	client   dynamic.Interface
+	metadata metadata.Interface // Für Listen, bei denen uns nur Name und Labels interessieren
+
+	// Lokaler List+Watch-Cache, wird durch StartInformers befüllt
+	informers         map[schema.GroupVersionResource]informers.GenericInformer
+	metadataInformers map[schema.GroupVersionResource]informers.GenericInformer
+	informersOnce     sync.Once // Die Maps oben werden ohne Lock gelesen und dürfen nur einmal gesetzt werden
+	informersErr      error
 }
 
 // NewManager ist der "Konstruktor" für unseren Capsule-Dienst
-func NewManager(client dynamic.Interface) *Manager {
+func NewManager(client dynamic.Interface, metadataClient metadata.Interface) *Manager {
 	return &Manager{
-		client: client,
+		client:   client,
+		metadata: metadataClient,
 	}
 }
 
@@ -38,11 +50,14 @@ func (m *Manager) CreateTenant(ctx context.Context, name string, owner string) e
 	obj := CreateTenantObject(name, owner)
 
 	// 2. Wir senden es an den Cluster
-	_, err := m.client.Resource(tenantGVR).Create(ctx, obj, metav1.CreateOptions{})
+	created, err := m.client.Resource(tenantGVR).Create(ctx, obj, metav1.CreateOptions{})
 	if err != nil {
 		return fmt.Errorf("fehler beim Erstellen des Tenants %s: %w", name, err)
 	}
 	fmt.Printf("Tenant %s erfolgreich erstellt.\n", name)
+
+	// 3. Auf den Cache warten
+	waitForCache(ctx, m.informers[tenantGVR], "", name, cacheHasObject(created.GetUID()))
 	return nil
 }
 
@@ -68,6 +83,8 @@ func (m *Manager) DeleteTenant(ctx context.Context, name string) error {
 		return fmt.Errorf("konnte Tenant %s nicht löschen: %w", name, err)
 	}
 	fmt.Printf("🗑️ Tenant %s erfolgreich gelöscht.\n", name)
+
+	waitForCache(ctx, m.informers[tenantGVR], "", name, cacheHasDeletion)
 	return nil
 
 }
@@ -101,31 +118,63 @@ func (m *Manager) UpdateTenantQuota(ctx context.Context, name string, newQuota i
 	}
 
 	fmt.Printf("🆙 Quota für Tenant %s auf %d erhöht.\n", name, newQuota)
+
+	// Die Tenant-Liste zeigt die Quota an – erst zurückkehren, wenn der Cache sie kennt
+	waitForCache(ctx, m.informers[tenantGVR], "", name, func(obj metav1.Object) bool {
+		item, ok := obj.(*unstructured.Unstructured)
+		if !ok {
+			return obj == nil // Inzwischen gelöscht, da gibt es nichts mehr zu warten
+		}
+		quota, _, _ := unstructured.NestedInt64(item.Object, "spec", "namespaceOptions", "quota")
+		return quota == newQuota
+	})
 	return nil
 }
 
-func (m *Manager) ListTenantsByOwner(ctx context.Context, userEmail string) ([]map[string]interface{}, error) {
-	list, err := m.client.Resource(tenantGVR).List(ctx, metav1.ListOptions{})
+// TenantInfo ist eine Kachel im Tenant-Dashboard des Frontends
+type TenantInfo struct {
+	ID       string         `json:"id"`
+	Name     string         `json:"name"`
+	State    string         `json:"state"`
+	Ready    bool           `json:"ready"`
+	Usage    TenantUsage    `json:"usage"`
+	Position TenantPosition `json:"position"`
+}
+
+// TenantUsage zeigt, wie viele Namespaces der Tenant von seiner Quota belegt
+type TenantUsage struct {
+	Current int64 `json:"current"`
+	Max     int64 `json:"max"`
+}
+
+// TenantPosition ist die Startposition der Kachel im Frontend
+type TenantPosition struct {
+	X int `json:"x"`
+	Y int `json:"y"`
+}
+
+func (m *Manager) ListTenantsByOwner(ctx context.Context, userEmail string) ([]TenantInfo, error) {
+	// Aus dem Owner-Index kommen direkt nur die Tenants des Users
+	items, indexed, err := listByIndex[*unstructured.Unstructured](m.informers[tenantGVR], tenantOwnerIndex, userEmail)
 	if err != nil {
 		return nil, err
 	}
-
-	var formattedTenants []map[string]interface{}
-
-	for _, item := range list.Items {
-		// --- 1. Filter Logik ---
-		owners, found, _ := unstructured.NestedSlice(item.Object, "spec", "owners")
-		if !found {
-			continue
+	if !indexed {
+		items, err = m.list(ctx, tenantGVR, "", labels.Everything())
+		if err != nil {
+			return nil, err
 		}
+	}
 
+	formattedTenants := make([]TenantInfo, 0, len(items))
+
+	for _, item := range items {
+		// --- 1. Filter Logik (greift nur noch, wenn die Liste ohne Index geholt wurde) ---
 		isOwner := false
-		for _, owner := range owners {
-			if ownerMap, ok := owner.(map[string]interface{}); ok {
-				if ownerMap["name"] == userEmail {
-					isOwner = true
-					break
-				}
+		for _, owner := range tenantOwners(item) {
+			if owner == userEmail {
+				isOwner = true
+				break
 			}
 		}
 
@@ -133,33 +182,51 @@ func (m *Manager) ListTenantsByOwner(ctx context.Context, userEmail string) ([]m
 			continue
 		}
 
-		// --- 2. Formatierung (direkt hier) ---
-		name := item.GetName()
-		status, _, _ := unstructured.NestedMap(item.Object, "status")
-
-		// Status Felder
-		state, _ := status["state"].(string)
-		// Capsule setzt oft Conditions. Wir prüfen hier das 'ready' Feld einfach direkt
-		readyStr, _ := status["ready"].(string)
-
-		nsCount, _, _ := unstructured.NestedInt64(status, "namespaceCount")
-		nsQuota, _, _ := unstructured.NestedInt64(item.Object, "spec", "namespaceOptions", "quota")
-
-		formattedTenants = append(formattedTenants, map[string]interface{}{
-			"id":    name,
-			"name":  name,
-			"state": state,
-			"ready": readyStr == "True",
-			"usage": map[string]interface{}{
-				"current": nsCount,
-				"max":     nsQuota,
-			},
-			"position": map[string]interface{}{
-				"x": 100,
-				"y": 100,
-			},
-		})
+		// --- 2. Formatierung ---
+		formattedTenants = append(formattedTenants, tenantInfo(item))
 	}
 
 	return formattedTenants, nil
 }
+
+// tenantInfo baut die Frontend-Kachel für einen Tenant
+func tenantInfo(item *unstructured.Unstructured) TenantInfo {
+	name := item.GetName()
+	status, _ := item.Object["status"].(map[string]interface{}) // NestedMap würde den Status deep-kopieren
+
+	// Status Felder
+	state, _ := status["state"].(string)
+	// Capsule setzt oft Conditions. Wir prüfen hier das 'ready' Feld einfach direkt
+	readyStr, _ := status["ready"].(string)
+
+	nsCount, _, _ := unstructured.NestedInt64(status, "namespaceCount")
+	nsQuota, _, _ := unstructured.NestedInt64(item.Object, "spec", "namespaceOptions", "quota")
+
+	return TenantInfo{
+		ID:    name,
+		Name:  name,
+		State: state,
+		Ready: readyStr == "True",
+		Usage: TenantUsage{
+			Current: nsCount,
+			Max:     nsQuota,
+		},
+		Position: TenantPosition{X: 100, Y: 100},
+	}
+}
+
+// tenantOwners liefert die Namen aller Owner aus spec.owners eines Tenants
+func tenantOwners(item *unstructured.Unstructured) []string {
+	ownersField, _, _ := unstructured.NestedFieldNoCopy(item.Object, "spec", "owners")
+	owners, _ := ownersField.([]interface{})
+
+	names := make([]string, 0, len(owners))
+	for _, owner := range owners {
+		if ownerMap, ok := owner.(map[string]interface{}); ok {
+			if name, ok := ownerMap["name"].(string); ok {
+				names = append(names, name)
+			}
+		}
+	}
+	return names
+}
@@ -8,6 +8,7 @@ import (
 	"k8s.io/apimachinery/pkg/api/errors"
 	metav1 "k8s.io/apimachinery/pkg/apis/meta/v1"
 	"k8s.io/apimachinery/pkg/apis/meta/v1/unstructured"
+	"k8s.io/apimachinery/pkg/labels"
 	"k8s.io/apimachinery/pkg/runtime/schema"
 )
 
@@ -18,25 +19,38 @@ var namespaceGVR = schema.GroupVersionResource{
 	Resource: "namespaces",
 }
 
-// ListNamespaces sucht alle Namespaces, die zu einem bestimmten Tenant gehören
-func (m *Manager) ListNamespaces(ctx context.Context, tenantName string) ([]map[string]interface{}, error) {
-	// Capsule markiert Namespaces mit Labels. Wir filtern direkt danach!
-	labelSelector := fmt.Sprintf("capsule.clastix.io/tenant=%s", tenantName)
+// tenantLabel ordnet einen Namespace in Capsule seinem Tenant zu
+const tenantLabel = "capsule.clastix.io/tenant"
+
+// NamespaceInfo ist eine Zeile in der Namespace-Liste des Frontends
+type NamespaceInfo struct {
+	ID   string `json:"id"`   // Die ID MUSS der echte K8s Name bleiben für Folge-Requests
+	Name string `json:"name"` // Der Anzeigename im Frontend (ohne Präfix)
+}
 
-	list, err := m.client.Resource(namespaceGVR).List(ctx, metav1.ListOptions{
-		LabelSelector: labelSelector,
-	})
+// ListNamespaces sucht alle Namespaces, die zu einem bestimmten Tenant gehören
+func (m *Manager) ListNamespaces(ctx context.Context, tenantName string) ([]NamespaceInfo, error) {
+	// Capsule markiert Namespaces mit Labels – im Cache liegen sie direkt nach Tenant indexiert
+	items, indexed, err := listByIndex[*metav1.PartialObjectMetadata](m.metadataInformers[namespaceGVR], namespaceTenantIndex, tenantName)
 	if err != nil {
 		return nil, err
 	}
+	if !indexed {
+		// Cache noch nicht bereit: der API-Server filtert nach dem Label
+		labelSelector := labels.SelectorFromSet(labels.Set{tenantLabel: tenantName})
+		items, err = m.listMetadata(ctx, namespaceGVR, "", labelSelector)
+		if err != nil {
+			return nil, err
+		}
+	}
 
-	var formattedNamespaces []map[string]interface{}
-	for _, item := range list.Items {
+	formattedNamespaces := make([]NamespaceInfo, 0, len(items))
+	for _, item := range items {
 		// Schneidet den Präfix für die Frontend-Anzeige ab (z.B. "kunde-a-development" -> "development")
 		cleanName := strings.TrimPrefix(item.GetName(), tenantName+"-")
-		formattedNamespaces = append(formattedNamespaces, map[string]interface{}{
-			"id":   item.GetName(), // Die ID MUSS der echte K8s Name bleiben für Folge-Requests
-			"name": cleanName,      // Der Anzeigename im Frontend (ohne Präfix)
+		formattedNamespaces = append(formattedNamespaces, NamespaceInfo{
+			ID:   item.GetName(),
+			Name: cleanName,
 		})
 	}
 
@@ -55,16 +69,17 @@ func (m *Manager) CreateNamespace(ctx context.Context, name string, tenantName s
 			"metadata": map[string]interface{}{
 				"name": prefixedName,
 				"labels": map[string]interface{}{
-					"capsule.clastix.io/tenant": tenantName, // Ordnet den Namespace dem Tenant zu
+					tenantLabel: tenantName, // Ordnet den Namespace dem Tenant zu
 				},
 			},
 		},
 	}
 
-	_, err := m.client.Resource(namespaceGVR).Create(ctx, obj, metav1.CreateOptions{})
+	created, err := m.client.Resource(namespaceGVR).Create(ctx, obj, metav1.CreateOptions{})
 	if err != nil {
 		return fmt.Errorf("fehler beim Erstellen des Namespaces %s: %w", prefixedName, err)
 	}
+	waitForCache(ctx, m.metadataInformers[namespaceGVR], "", prefixedName, cacheHasObject(created.GetUID()))
 	return nil
 }
 
@@ -78,5 +93,6 @@ func (m *Manager) DeleteNamespace(ctx context.Context, name string) error {
 		}
 		return fmt.Errorf("fehler beim Löschen des Namespaces %s: %w", name, err)
 	}
+	waitForCache(ctx, m.metadataInformers[namespaceGVR], "", name, cacheHasDeletion)
 	return nil
 }
@@ -6,6 +6,7 @@ import (
 
 	metav1 "k8s.io/apimachinery/pkg/apis/meta/v1"
 	"k8s.io/apimachinery/pkg/apis/meta/v1/unstructured"
+	"k8s.io/apimachinery/pkg/labels"
 	"k8s.io/apimachinery/pkg/runtime/schema"
 )
 
@@ -15,6 +16,13 @@ var networkPolicyGVR = schema.GroupVersionResource{
 	Resource: "networkpolicies",
 }
 
+// NetworkPolicyInfo ist eine Zeile in der NetworkPolicy-Liste des Frontends.
+// Fürs Frontend reicht der Name und die ID, um die "Verbindungen" anzuzeigen.
+type NetworkPolicyInfo struct {
+	ID   string `json:"id"`
+	Name string `json:"name"`
+}
+
 // CreateNetworkPolicy erlaubt Traffic von einem Quell-Namespace in den Ziel-Namespace
 func (m *Manager) CreateNetworkPolicy(ctx context.Context, targetNamespace, name, sourceNamespace string) error {
 	obj := &unstructured.Unstructured{
@@ -47,25 +55,25 @@ func (m *Manager) CreateNetworkPolicy(ctx context.Context, targetNamespace, name
 		},
 	}
 
-	_, err := m.client.Resource(networkPolicyGVR).Namespace(targetNamespace).Create(ctx, obj, metav1.CreateOptions{})
+	created, err := m.client.Resource(networkPolicyGVR).Namespace(targetNamespace).Create(ctx, obj, metav1.CreateOptions{})
 	if err != nil {
 		return fmt.Errorf("fehler beim Erstellen der NetworkPolicy %s: %w", name, err)
 	}
+	waitForCache(ctx, m.metadataInformers[networkPolicyGVR], targetNamespace, name, cacheHasObject(created.GetUID()))
 	return nil
 }
 
-func (m *Manager) ListNetworkPolicies(ctx context.Context, namespace string) ([]map[string]interface{}, error) {
-	list, err := m.client.Resource(networkPolicyGVR).Namespace(namespace).List(ctx, metav1.ListOptions{})
+func (m *Manager) ListNetworkPolicies(ctx context.Context, namespace string) ([]NetworkPolicyInfo, error) {
+	items, err := m.listMetadata(ctx, networkPolicyGVR, namespace, labels.Everything())
 	if err != nil {
 		return nil, err
 	}
 
-	var formattedPolicies []map[string]interface{}
-	for _, item := range list.Items {
-		// Fürs Frontend reicht meist der Name und die ID, um die "Verbindungen" anzuzeigen
-		formattedPolicies = append(formattedPolicies, map[string]interface{}{
-			"id":   item.GetName(),
-			"name": item.GetName(),
+	formattedPolicies := make([]NetworkPolicyInfo, 0, len(items))
+	for _, item := range items {
+		formattedPolicies = append(formattedPolicies, NetworkPolicyInfo{
+			ID:   item.GetName(),
+			Name: item.GetName(),
 		})
 	}
 	return formattedPolicies, nil
@@ -76,5 +84,6 @@ func (m *Manager) DeleteNetworkPolicy(ctx context.Context, namespace, name strin
 	if err != nil {
 		return fmt.Errorf("fehler beim Löschen der NetworkPolicy %s: %w", name, err)
 	}
+	waitForCache(ctx, m.metadataInformers[networkPolicyGVR], namespace, name, cacheHasDeletion)
 	return nil
 }
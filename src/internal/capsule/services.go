@@ -6,7 +6,9 @@ import (
 
 	metav1 "k8s.io/apimachinery/pkg/apis/meta/v1"
 	"k8s.io/apimachinery/pkg/apis/meta/v1/unstructured"
+	"k8s.io/apimachinery/pkg/labels"
 	"k8s.io/apimachinery/pkg/runtime/schema"
+	"k8s.io/apimachinery/pkg/util/intstr"
 )
 
 var serviceGVR = schema.GroupVersionResource{
@@ -15,6 +17,23 @@ var serviceGVR = schema.GroupVersionResource{
 	Resource: "services",
 }
 
+// ServiceInfo ist eine Zeile in der Service-Liste des Frontends
+type ServiceInfo struct {
+	ID        string        `json:"id"`
+	Name      string        `json:"name"`
+	Type      string        `json:"type"`
+	ClusterIP string        `json:"clusterIP"`
+	Ports     []ServicePort `json:"ports"`
+}
+
+// ServicePort übernimmt die Werte aus der Spec (targetPort kann auch ein Name sein).
+// nodePort gibt es nur bei NodePort/LoadBalancer-Services – sonst lassen wir das Feld ganz weg.
+type ServicePort struct {
+	Port       int64              `json:"port"`
+	TargetPort intstr.IntOrString `json:"targetPort"`
+	NodePort   int64              `json:"nodePort,omitempty"`
+}
+
 // CreateService erstellt einen Service, der den Traffic an ein Deployment weiterleitet
 func (m *Manager) CreateService(ctx context.Context, namespace, name, appName string, port, targetPort int, serviceType string) error {
 	if serviceType == "" {
@@ -44,47 +63,68 @@ func (m *Manager) CreateService(ctx context.Context, namespace, name, appName st
 		},
 	}
 
-	_, err := m.client.Resource(serviceGVR).Namespace(namespace).Create(ctx, obj, metav1.CreateOptions{})
+	created, err := m.client.Resource(serviceGVR).Namespace(namespace).Create(ctx, obj, metav1.CreateOptions{})
 	if err != nil {
 		return fmt.Errorf("fehler beim Erstellen des Services %s: %w", name, err)
 	}
+	waitForCache(ctx, m.informers[serviceGVR], namespace, name, cacheHasObject(created.GetUID()))
 	return nil
 }
 
 // ListServices listet alle Services im angegebenen Namespace auf
-func (m *Manager) ListServices(ctx context.Context, namespace string) ([]map[string]interface{}, error) {
-	list, err := m.client.Resource(serviceGVR).Namespace(namespace).List(ctx, metav1.ListOptions{})
+func (m *Manager) ListServices(ctx context.Context, namespace string) ([]ServiceInfo, error) {
+	items, err := m.list(ctx, serviceGVR, namespace, labels.Everything())
 	if err != nil {
 		return nil, err
 	}
 
-	var formattedServices []map[string]interface{}
-	for _, item := range list.Items {
-		clusterIP, _, _ := unstructured.NestedString(item.Object, "spec", "clusterIP")
-		svcType, _, _ := unstructured.NestedString(item.Object, "spec", "type")
+	formattedServices := make([]ServiceInfo, 0, len(items))
+	for _, item := range items {
+		formattedServices = append(formattedServices, serviceInfo(item))
+	}
+	return formattedServices, nil
+}
 
-		// Ports auslesen
-		ports, _, _ := unstructured.NestedSlice(item.Object, "spec", "ports")
-		var portList []map[string]interface{}
-		for _, p := range ports {
-			if pMap, ok := p.(map[string]interface{}); ok {
-				portList = append(portList, map[string]interface{}{
-					"port":       pMap["port"],
-					"targetPort": pMap["targetPort"],
-					"nodePort":   pMap["nodePort"], // Wichtig für NodePort-Services
-				})
-			}
+// serviceInfo baut die Frontend-Zeile für einen Service.
+// Die Spec wird einmal aufgelöst und ohne Deep-Copy gelesen (die Objekte kommen aus dem Cache).
+func serviceInfo(item *unstructured.Unstructured) ServiceInfo {
+	spec, _ := item.Object["spec"].(map[string]interface{})
+	clusterIP, _ := spec["clusterIP"].(string)
+	svcType, _ := spec["type"].(string)
+
+	// Ports auslesen
+	ports, _ := spec["ports"].([]interface{})
+	portList := make([]ServicePort, 0, len(ports))
+	for _, p := range ports {
+		if pMap, ok := p.(map[string]interface{}); ok {
+			port, _ := pMap["port"].(int64)
+			nodePort, _ := pMap["nodePort"].(int64)
+			portList = append(portList, ServicePort{
+				Port:       port,
+				TargetPort: servicePortTarget(pMap["targetPort"]),
+				NodePort:   nodePort,
+			})
 		}
+	}
 
-		formattedServices = append(formattedServices, map[string]interface{}{
-			"id":        item.GetName(),
-			"name":      item.GetName(),
-			"type":      svcType,
-			"clusterIP": clusterIP,
-			"ports":     portList,
-		})
+	return ServiceInfo{
+		ID:        item.GetName(),
+		Name:      item.GetName(),
+		Type:      svcType,
+		ClusterIP: clusterIP,
+		Ports:     portList,
 	}
-	return formattedServices, nil
+}
+
+// servicePortTarget wandelt den targetPort aus der Spec um – entweder eine Portnummer oder ein benannter Port
+func servicePortTarget(value interface{}) intstr.IntOrString {
+	switch v := value.(type) {
+	case int64:
+		return intstr.FromInt32(int32(v))
+	case string:
+		return intstr.FromString(v)
+	}
+	return intstr.IntOrString{}
 }
 
 // DeleteService löscht einen Service
@@ -93,5 +133,6 @@ func (m *Manager) DeleteService(ctx context.Context, namespace, name string) err
 	if err != nil {
 		return fmt.Errorf("fehler beim Löschen des Services %s: %w", name, err)
 	}
+	waitForCache(ctx, m.informers[serviceGVR], namespace, name, cacheHasDeletion)
 	return nil
 }
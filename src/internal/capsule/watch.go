@@ -0,0 +1,158 @@
+package capsule
+
+import (
+	"context"
+	"fmt"
+	"sync"
+	"time"
+
+	"k8s.io/apimachinery/pkg/apis/meta/v1/unstructured"
+	"k8s.io/apimachinery/pkg/util/wait"
+	"k8s.io/client-go/informers"
+	"k8s.io/client-go/tools/cache"
+)
+
+// Event-Typen im Stream. "reset" und "synced" umschließen den Anfangsstand: bei "reset" beginnt das
+// Frontend eine neue Liste, bei "synced" ersetzt diese die alte. So verschwinden nach einem Reconnect
+// auch Zeilen, deren Objekte während der Unterbrechung gelöscht wurden.
+const (
+	EventReset  = "reset"
+	EventUpsert = "upsert"
+	EventDelete = "delete"
+	EventSynced = "synced"
+)
+
+// ResourceEvent ist eine einzelne Änderung an einer Frontend-Zeile (PodInfo, DeploymentInfo, ...)
+type ResourceEvent[T comparable] struct {
+	Type string `json:"type"` // EventUpsert, EventDelete bzw. ohne Row EventReset und EventSynced
+	Row  T      `json:"row"`
+}
+
+// RowStream puffert die Events eines Watches für genau einen Leser.
+// Mehrere Änderungen am selben Objekt werden zusammengefasst (die neueste gewinnt) – der Puffer
+// wächst also höchstens auf die Anzahl der Objekte im Namespace, egal wie langsam der Leser ist.
+type RowStream[T comparable] struct {
+	mu      sync.Mutex
+	pending []ResourceEvent[T]
+	index   map[string]int // Objekt-Name -> Position in pending
+	ready   chan struct{}
+}
+
+func newRowStream[T comparable]() *RowStream[T] {
+	return &RowStream[T]{
+		index: make(map[string]int),
+		ready: make(chan struct{}, 1),
+	}
+}
+
+// Ready meldet, dass Drain neue Events liefert
+func (s *RowStream[T]) Ready() <-chan struct{} {
+	return s.ready
+}
+
+// Drain liefert alle seit dem letzten Aufruf angefallenen Events in ihrer Reihenfolge
+func (s *RowStream[T]) Drain() []ResourceEvent[T] {
+	s.mu.Lock()
+	defer s.mu.Unlock()
+
+	events := s.pending
+	s.pending = nil
+	clear(s.index)
+	return events
+}
+
+// push reiht ein Event ein. Wartet für key schon eins, wird es an seiner Stelle ersetzt.
+// Events mit leerem key werden nie zusammengefasst.
+func (s *RowStream[T]) push(key string, event ResourceEvent[T]) {
+	s.mu.Lock()
+	if i, ok := s.index[key]; ok && key != "" {
+		s.pending[i] = event
+	} else {
+		if key != "" {
+			s.index[key] = len(s.pending)
+		}
+		s.pending = append(s.pending, event)
+	}
+	s.mu.Unlock()
+
+	select {
+	case s.ready <- struct{}{}:
+	default: // Der Leser ist schon benachrichtigt
+	}
+}
+
+// WatchPods meldet jede Änderung an den Pods eines Namespaces, bis ctx endet
+func (m *Manager) WatchPods(ctx context.Context, namespace string) (*RowStream[PodInfo], error) {
+	return watchRows(ctx, m.informers[podGVR], namespace, podInfo)
+}
+
+// WatchDeployments meldet jede Änderung an den Deployments eines Namespaces, bis ctx endet
+func (m *Manager) WatchDeployments(ctx context.Context, namespace string) (*RowStream[DeploymentInfo], error) {
+	return watchRows(ctx, m.informers[deploymentGVR], namespace, deploymentInfo)
+}
+
+// watchRows hängt sich an einen laufenden Informer und übersetzt seine Events in Frontend-Zeilen.
+// Zu Beginn kommt "reset", für jedes bestehende Objekt ein "upsert" und dann "synced", danach nur noch Deltas.
+// Die Handler des Informers blockieren nie – ein langsamer Leser bekommt nur den jeweils neuesten Stand.
+func watchRows[T comparable](ctx context.Context, informer informers.GenericInformer, namespace string, build func(*unstructured.Unstructured) T) (*RowStream[T], error) {
+	if informer == nil {
+		return nil, fmt.Errorf("der Informer läuft nicht, Streaming ist nicht verfügbar")
+	}
+
+	stream := newRowStream[T]()
+	stream.push("", ResourceEvent[T]{Type: EventReset})
+	send := func(eventType string, item *unstructured.Unstructured, row T) {
+		stream.push(item.GetName(), ResourceEvent[T]{Type: eventType, Row: row})
+	}
+
+	registration, err := informer.Informer().AddEventHandler(cache.ResourceEventHandlerFuncs{
+		AddFunc: func(obj interface{}) {
+			if item, ok := obj.(*unstructured.Unstructured); ok && item.GetNamespace() == namespace {
+				send(EventUpsert, item, build(item))
+			}
+		},
+		UpdateFunc: func(oldObj, newObj interface{}) {
+			oldItem, ok := oldObj.(*unstructured.Unstructured)
+			if !ok {
+				return
+			}
+			newItem, ok := newObj.(*unstructured.Unstructured)
+			if !ok || newItem.GetNamespace() != namespace {
+				return
+			}
+
+			// Die meisten Updates betreffen Felder, die das Frontend gar nicht anzeigt
+			if row := build(newItem); row != build(oldItem) {
+				send(EventUpsert, newItem, row)
+			}
+		},
+		DeleteFunc: func(obj interface{}) {
+			// Hat der Informer das Löschen verpasst, bekommen wir nur den letzten bekannten Stand
+			if tombstone, ok := obj.(cache.DeletedFinalStateUnknown); ok {
+				obj = tombstone.Obj
+			}
+			if item, ok := obj.(*unstructured.Unstructured); ok && item.GetNamespace() == namespace {
+				send(EventDelete, item, build(item))
+			}
+		},
+	})
+	if err != nil {
+		return nil, err
+	}
+
+	go func() {
+		// HasSynced wird erst wahr, wenn der Handler alle bestehenden Objekte verarbeitet hat –
+		// "synced" landet also garantiert hinter dem letzten "upsert" des Anfangsstands
+		err := wait.PollUntilContextCancel(ctx, 20*time.Millisecond, true, func(context.Context) (bool, error) {
+			return registration.HasSynced(), nil
+		})
+		if err == nil {
+			stream.push("", ResourceEvent[T]{Type: EventSynced})
+		}
+
+		<-ctx.Done()
+		informer.Informer().RemoveEventHandler(registration)
+	}()
+
+	return stream, nil
+}
@@ -0,0 +1,279 @@
+package capsule
+
+import (
+	"context"
+	"sync"
+	"testing"
+	"time"
+
+	metav1 "k8s.io/apimachinery/pkg/apis/meta/v1"
+	"k8s.io/apimachinery/pkg/apis/meta/v1/unstructured"
+	"k8s.io/apimachinery/pkg/runtime"
+	"k8s.io/apimachinery/pkg/runtime/schema"
+	"k8s.io/apimachinery/pkg/watch"
+	"k8s.io/client-go/dynamic/dynamicinformer"
+	dynamicfake "k8s.io/client-go/dynamic/fake"
+	"k8s.io/client-go/informers"
+	k8stesting "k8s.io/client-go/testing"
+	"k8s.io/client-go/tools/cache"
+)
+
+func testDeployment(namespace, name, image string) *unstructured.Unstructured {
+	return &unstructured.Unstructured{
+		Object: map[string]interface{}{
+			"apiVersion": "apps/v1",
+			"kind":       "Deployment",
+			"metadata": map[string]interface{}{
+				"name":      name,
+				"namespace": namespace,
+			},
+			"spec": map[string]interface{}{
+				"replicas": int64(1),
+				"template": map[string]interface{}{
+					"spec": map[string]interface{}{
+						"containers": []interface{}{
+							map[string]interface{}{"name": "app", "image": image},
+						},
+					},
+				},
+			},
+		},
+	}
+}
+
+// startDeploymentInformer startet einen Informer auf einem Fake-Client und wartet,
+// bis sowohl die Liste geladen als auch der Watch aufgebaut ist
+func startDeploymentInformer(t *testing.T, ctx context.Context, objects ...runtime.Object) (*dynamicfake.FakeDynamicClient, informers.GenericInformer) {
+	t.Helper()
+
+	client := dynamicfake.NewSimpleDynamicClientWithCustomListKinds(runtime.NewScheme(),
+		map[schema.GroupVersionResource]string{deploymentGVR: "DeploymentList"}, objects...)
+
+	// Der Fake-Tracker verliert Änderungen, die vor dem Watch passieren – daher warten wir auf ihn
+	watchStarted := make(chan struct{})
+	var once sync.Once
+	client.PrependWatchReactor("deployments", func(action k8stesting.Action) (bool, watch.Interface, error) {
+		w, err := client.Tracker().Watch(deploymentGVR, action.GetNamespace())
+		once.Do(func() { close(watchStarted) })
+		return true, w, err
+	})
+
+	factory := dynamicinformer.NewDynamicSharedInformerFactory(client, 0)
+	informer := factory.ForResource(deploymentGVR)
+	informer.Informer() // Registriert den Informer, bevor die Factory startet
+	factory.Start(ctx.Done())
+
+	if !cache.WaitForCacheSync(ctx.Done(), informer.Informer().HasSynced) {
+		t.Fatal("Informer nicht synchronisiert")
+	}
+	select {
+	case <-watchStarted:
+	case <-time.After(5 * time.Second):
+		t.Fatal("Watch wurde nicht gestartet")
+	}
+	return client, informer
+}
+
+// collect liest Events, bis until erfüllt ist
+func collect[T comparable](t *testing.T, stream *RowStream[T], until func(ResourceEvent[T]) bool) []ResourceEvent[T] {
+	t.Helper()
+
+	timeout := time.After(5 * time.Second)
+	var events []ResourceEvent[T]
+	for {
+		select {
+		case <-stream.Ready():
+			for _, event := range stream.Drain() {
+				events = append(events, event)
+				if until(event) {
+					return events
+				}
+			}
+		case <-timeout:
+			t.Fatalf("Timeout, bisher empfangen: %+v", events)
+		}
+	}
+}
+
+func TestRowStreamCoalescesPerObject(t *testing.T) {
+	stream := newRowStream[PodInfo]()
+	stream.push("a", ResourceEvent[PodInfo]{Type: EventUpsert, Row: PodInfo{Name: "a", Phase: "Pending"}})
+	stream.push("b", ResourceEvent[PodInfo]{Type: EventUpsert, Row: PodInfo{Name: "b", Phase: "Running"}})
+	stream.push("a", ResourceEvent[PodInfo]{Type: EventUpsert, Row: PodInfo{Name: "a", Phase: "Running"}})
+	stream.push("a", ResourceEvent[PodInfo]{Type: EventDelete, Row: PodInfo{Name: "a", Phase: "Running"}})
+	stream.push("", ResourceEvent[PodInfo]{Type: "marker"})
+	stream.push("", ResourceEvent[PodInfo]{Type: "marker"})
+
+	select {
+	case <-stream.Ready():
+	default:
+		t.Fatal("Ready wurde nicht signalisiert")
+	}
+
+	got := stream.Drain()
+	want := []ResourceEvent[PodInfo]{
+		{Type: EventDelete, Row: PodInfo{Name: "a", Phase: "Running"}},
+		{Type: EventUpsert, Row: PodInfo{Name: "b", Phase: "Running"}},
+		{Type: "marker"},
+		{Type: "marker"},
+	}
+	if len(got) != len(want) {
+		t.Fatalf("Drain = %+v, erwartet %+v", got, want)
+	}
+	for i := range want {
+		if got[i] != want[i] {
+			t.Errorf("Event %d = %+v, erwartet %+v", i, got[i], want[i])
+		}
+	}
+
+	// Nach dem Drain ist nichts mehr da – auch kein veralteter Index-Eintrag
+	if rest := stream.Drain(); len(rest) != 0 {
+		t.Errorf("zweiter Drain = %+v, erwartet leer", rest)
+	}
+	stream.push("a", ResourceEvent[PodInfo]{Type: EventUpsert, Row: PodInfo{Name: "a"}})
+	if got := stream.Drain(); len(got) != 1 || got[0].Type != EventUpsert {
+		t.Errorf("Drain nach neuem Push = %+v", got)
+	}
+}
+
+func TestWatchRowsReplaysAndSkipsUnchangedUpdates(t *testing.T) {
+	ctx, cancel := context.WithCancel(context.Background())
+	defer cancel()
+
+	client, informer := startDeploymentInformer(t, ctx,
+		testDeployment("default", "web", "nginx:1.25"),
+		testDeployment("default", "api", "api:1"),
+		testDeployment("other", "fremd", "nginx:1.25"),
+	)
+
+	stream, err := watchRows(ctx, informer, "default", deploymentInfo)
+	if err != nil {
+		t.Fatal(err)
+	}
+
+	// 1. Anfangsstand: "reset", jedes Deployment des Namespaces genau einmal (fremde nicht), dann "synced"
+	events := collect(t, stream, func(event ResourceEvent[DeploymentInfo]) bool {
+		return event.Type == EventSynced
+	})
+	if events[0].Type != EventReset {
+		t.Fatalf("erstes Event = %+v, erwartet %q", events[0], EventReset)
+	}
+	seen := map[string]int{}
+	for _, event := range events[1 : len(events)-1] {
+		if event.Type != EventUpsert {
+			t.Errorf("unerwartetes Event im Anfangsstand: %+v", event)
+		}
+		seen[event.Row.Name]++
+	}
+	if len(seen) != 2 || seen["web"] != 1 || seen["api"] != 1 {
+		t.Fatalf("Anfangsstand = %v, erwartet web und api je einmal", seen)
+	}
+
+	deployments := client.Resource(deploymentGVR).Namespace("default")
+
+	// 2. Nur ein Label ändern – das Frontend sieht davon nichts, also darf kein Event kommen
+	web, err := deployments.Get(ctx, "web", metav1.GetOptions{})
+	if err != nil {
+		t.Fatal(err)
+	}
+	web.SetLabels(map[string]string{"team": "blau"})
+	if _, err := deployments.Update(ctx, web, metav1.UpdateOptions{}); err != nil {
+		t.Fatal(err)
+	}
+
+	// 3. Das Image von api ändern. Der Informer liefert die Events der Reihe nach:
+	// kommt api an, wäre ein Event für web schon vorher da gewesen.
+	api, err := deployments.Get(ctx, "api", metav1.GetOptions{})
+	if err != nil {
+		t.Fatal(err)
+	}
+	if err := unstructured.SetNestedSlice(api.Object, []interface{}{
+		map[string]interface{}{"name": "app", "image": "api:2"},
+	}, "spec", "template", "spec", "containers"); err != nil {
+		t.Fatal(err)
+	}
+	if _, err := deployments.Update(ctx, api, metav1.UpdateOptions{}); err != nil {
+		t.Fatal(err)
+	}
+
+	events = collect(t, stream, func(event ResourceEvent[DeploymentInfo]) bool {
+		return event.Row.Name == "api"
+	})
+	for _, event := range events {
+		if event.Row.Name == "web" {
+			t.Errorf("Label-Änderung hat ein Event erzeugt: %+v", event)
+		}
+	}
+	if last := events[len(events)-1]; last.Type != EventUpsert || last.Row.Image != "api:2" {
+		t.Errorf("Update für api = %+v, erwartet upsert mit Image api:2", last)
+	}
+
+	// 4. Löschen kommt als "delete" mit der letzten bekannten Zeile
+	if err := deployments.Delete(ctx, "api", metav1.DeleteOptions{}); err != nil {
+		t.Fatal(err)
+	}
+	events = collect(t, stream, func(event ResourceEvent[DeploymentInfo]) bool {
+		return event.Type == EventDelete
+	})
+	if last := events[len(events)-1]; last.Row.Name != "api" {
+		t.Errorf("delete = %+v, erwartet api", last)
+	}
+}
+
+func TestWatchRowsCoalescesForSlowReader(t *testing.T) {
+	ctx, cancel := context.WithCancel(context.Background())
+	defer cancel()
+
+	client, informer := startDeploymentInformer(t, ctx, testDeployment("default", "web", "web:0"))
+
+	stream, err := watchRows(ctx, informer, "default", deploymentInfo)
+	if err != nil {
+		t.Fatal(err)
+	}
+	collect(t, stream, func(event ResourceEvent[DeploymentInfo]) bool { return event.Type == EventSynced })
+
+	// Viele Updates, während niemand liest: der Handler darf nicht blockieren,
+	// und der Leser bekommt am Ende nur den neuesten Stand.
+	// Unter 100 bleiben, sonst läuft der Puffer des Fake-Watchers über und er panict.
+	deployments := client.Resource(deploymentGVR).Namespace("default")
+	const updates = 50
+	for i := 1; i <= updates; i++ {
+		web, err := deployments.Get(ctx, "web", metav1.GetOptions{})
+		if err != nil {
+			t.Fatal(err)
+		}
+		if err := unstructured.SetNestedField(web.Object, int64(i), "spec", "replicas"); err != nil {
+			t.Fatal(err)
+		}
+		if _, err := deployments.Update(ctx, web, metav1.UpdateOptions{}); err != nil {
+			t.Fatal(err)
+		}
+	}
+
+	// Warten, bis der Handler das letzte Update verarbeitet hat
+	deadline := time.Now().Add(5 * time.Second)
+	for {
+		stream.mu.Lock()
+		var last ResourceEvent[DeploymentInfo]
+		if len(stream.pending) > 0 {
+			last = stream.pending[len(stream.pending)-1]
+		}
+		pending := len(stream.pending)
+		stream.mu.Unlock()
+
+		if last.Row.Replicas == updates {
+			if pending != 1 {
+				t.Errorf("%d Events gepuffert, erwartet 1 zusammengefasstes", pending)
+			}
+			break
+		}
+		if time.Now().After(deadline) {
+			t.Fatalf("letztes Update kam nicht an, zuletzt gepuffert: %+v", last)
+		}
+		time.Sleep(10 * time.Millisecond)
+	}
+
+	if got := stream.Drain(); len(got) != 1 || got[0].Row.Replicas != updates {
+		t.Errorf("Drain = %+v, erwartet genau ein upsert mit replicas=%d", got, updates)
+	}
+}